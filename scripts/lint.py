@@ -19,93 +19,419 @@ Usage:
     lint.py path/to/project  # Lint specific cargo projects
     lint.py -g               # Process git-modified projects
     lint.py --fix            # Attempt automatic fixes (cargo fix)
+    lint.py -g --jobs 2      # Limit the number of concurrent cargo runs
+    lint.py --no-cache       # Ignore cached results from previous clean runs
 """
 
-import argparse
+# Only cheap or already-loaded modules are imported here; the rest are imported
+# where they are first needed to keep the bare invocation fast
+import functools
+import io
 import os
 import subprocess
 import sys
-from abc import ABC
-from dataclasses import dataclass
+import threading
+from collections import defaultdict, namedtuple
+from collections.abc import AsyncIterator, Callable
 
-# ANSI color codes
-GREEN = "\033[92m"
-RED = "\033[91m"
-BLUE = "\033[94m"
-RESET = "\033[0m"
+# ANSI color codes, only emitted when writing to a terminal (and NO_COLOR is unset)
+_TTY = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+GREEN = "\033[92m" if _TTY else ""
+RED = "\033[91m" if _TTY else ""
+BLUE = "\033[94m" if _TTY else ""
+RESET = "\033[0m" if _TTY else ""
 
 # Default directory to run the commands on (typically the project root)
 DEFAULT_CARGO_DIR = "."
 
+# Where results of clean, read-only tool runs are remembered between invocations
+CACHE_FILE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "rustlint",
+    "results.json",
+)
+
+# Directories whose contents never affect the cached result: cargo build output
+# and JavaScript dependency trees (e.g. a docs site next to the crate)
+CACHE_SKIPPED_DIRS = frozenset({"target", "node_modules"})
+
+# Configuration looked up by cargo, rustup and clippy in the working directory
+# and each of its ancestors
+CACHE_ANCESTOR_INPUTS = (
+    os.path.join(".cargo", "config"),
+    os.path.join(".cargo", "config.toml"),
+    "rust-toolchain",
+    "rust-toolchain.toml",
+    "clippy.toml",
+    ".clippy.toml",
+)
+
+# Environment variables that change what the cached tools report
+CACHE_INPUT_ENV = (
+    "RUSTFLAGS",
+    "CARGO_ENCODED_RUSTFLAGS",
+    "CLIPPY_CONF_DIR",
+    "CARGO_HOME",
+    "RUSTUP_TOOLCHAIN",
+)
+
+# Manifest tables whose entries may name path dependencies
+DEPENDENCY_TABLES = ("dependencies", "dev-dependencies", "build-dependencies")
+
+
+class RustTool(namedtuple("RustTool", "name command cacheable", defaults=(False,))):
+    """A cargo command (``name``, ``command`` tuple), such as a formatter or linter.
+
+    Only tools that do not modify the sources (e.g. clippy) should be ``cacheable``.
+    """
 
-# pylint: disable=too-few-public-methods
-@dataclass
-class ToolResult:
-    """Result of running a tool."""
+    __slots__ = ()
 
-    name: str
-    success: bool
-    stdout: str
-    stderr: str
 
+class ToolResult(namedtuple("ToolResult", "name success stdout stderr")):
+    """Result of running a tool: its ``name``, ``success`` flag and output."""
 
-class BaseRustTool(ABC):
-    """Base class for Rust tools like format, linter, and fixer."""
+    __slots__ = ()
 
-    def __init__(self, name: str, command_factory):
-        """Initialize the BaseRustTool with a name and a command factory function."""
-        self.name = name
-        self.command_factory = command_factory
 
-    def run(self, directory: str) -> ToolResult:
-        """Run the tool command in the given directory.
+@functools.lru_cache(maxsize=None)
+def _tomllib():
+    """Import and return ``tomllib``, or None on Python < 3.11."""
+    try:
+        import tomllib  # pylint: disable=import-outside-toplevel
+    except ModuleNotFoundError:
+        return None
+    return tomllib
 
-        If the directory is not a valid Cargo project (i.e., Cargo.toml is missing),
-        this method skips execution and returns a success result indicating the skip.
-        """
-        if not os.path.exists(os.path.join(directory, "Cargo.toml")):
-            print(
-                f"{BLUE}Skipping {directory}: "
-                f"Cargo.toml not found (not a Rust project).{RESET}"
-            )
-            return ToolResult(self.name, True, f"Skipped {directory}", "")
-        command = self.command_factory(directory)
+
+LINTERS = {
+    "clippy": RustTool(
+        "clippy", ("cargo", "clippy", "--", "-D", "warnings"), cacheable=True
+    ),
+}
+FORMATTERS = {
+    "fmt": RustTool("fmt", ("cargo", "fmt")),
+}
+FIXERS = {
+    "fix": RustTool("fix", ("cargo", "fix")),
+}
+UNSAFE_FIXERS = {
+    "fix": RustTool("fix", ("cargo", "fix", "--allow-dirty", "--allow-staged")),
+}
+
+# Serialises result output from concurrent tool runs
+_PRINT_LOCK = threading.Lock()
+
+
+def _scan_inputs(directory: str, entries: list[tuple[str, int, int]]) -> None:
+    """Append ``(path, mtime_ns, size)`` for every file under ``directory``.
+
+    Any file may be compiled in (e.g. via ``include_str!``), so all of them are
+    included. Hidden directories and ``CACHE_SKIPPED_DIRS`` are not traversed.
+    Raises OSError if any part of the tree cannot be read.
+    """
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    name = entry.name
+                    if name not in CACHE_SKIPPED_DIRS and not name.startswith("."):
+                        stack.append(entry.path)
+                else:
+                    st = entry.stat()
+                    entries.append((entry.path, st.st_mtime_ns, st.st_size))
+
+
+def _manifest_path_dependencies(manifest_dir: str) -> list[str]:
+    """Return the directories of path dependencies declared in ``manifest_dir``."""
+    with open(os.path.join(manifest_dir, "Cargo.toml"), "rb") as f:
+        manifest = _tomllib().load(f)
+
+    tables = [manifest, manifest.get("workspace", {})]
+    tables.extend(manifest.get("target", {}).values())
+    specs = []
+    for table in tables:
+        for name in DEPENDENCY_TABLES:
+            specs.extend(table.get(name, {}).values())
+    for patches in manifest.get("patch", {}).values():
+        specs.extend(patches.values())
+    return [
+        os.path.normpath(os.path.join(manifest_dir, spec["path"]))
+        for spec in specs
+        if isinstance(spec, dict) and isinstance(spec.get("path"), str)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _tool_version(command: tuple[str, ...], directory: str) -> str | None:
+    """Return the ``--version`` output of a cargo subcommand run in ``directory``."""
+    try:
         process = subprocess.run(
-            command,
+            [*command[:2], "--version"],
             cwd=directory,
             capture_output=True,
             text=True,
             check=False,
         )
+    except OSError:
+        return None
+    return process.stdout.strip() if process.returncode == 0 else None
+
+
+def inputs_digest(tool: RustTool, directory: str) -> str | None:
+    """Compute a digest of everything that can change the result of ``tool``.
+
+    This covers every file in the whole workspace and in each path dependency
+    (see ``_scan_inputs`` for what is skipped), cargo/rustup/clippy configuration
+    in the directory's ancestors, relevant environment variables, and the tool's
+    version. Only file metadata (path, mtime, size) is hashed, so no file contents
+    are read.
+
+    Returns None if any input cannot be determined, in which case the result must
+    not be cached.
+    """
+    if _tomllib() is None:
+        return None
+    version = _tool_version(tool.command, directory)
+    if version is None:
+        return None
+
+    root = locate_workspace_root(directory) or directory
+    entries: list[tuple[str, int, int]] = []
+    try:
+        # Walk the workspace and, transitively, every path dependency
+        roots = [root]
+        pending = [directory, root]
+        seen_manifests: set[str] = set()
+        while pending:
+            manifest_dir = pending.pop()
+            if manifest_dir in seen_manifests:
+                continue
+            seen_manifests.add(manifest_dir)
+            for dep in _manifest_path_dependencies(manifest_dir):
+                pending.append(dep)
+                if not any(os.path.commonpath([dep, r]) == r for r in roots):
+                    roots.append(dep)
+        for input_root in roots:
+            _scan_inputs(input_root, entries)
+
+        # Configuration discovered by walking up from the working directory
+        cargo_home = os.environ.get("CARGO_HOME") or os.path.expanduser("~/.cargo")
+        config_paths = [
+            os.path.join(cargo_home, "config"),
+            os.path.join(cargo_home, "config.toml"),
+        ]
+        curr_dir = directory
+        while True:
+            config_paths.extend(
+                os.path.join(curr_dir, name) for name in CACHE_ANCESTOR_INPUTS
+            )
+            parent = os.path.dirname(curr_dir)
+            if parent == curr_dir:
+                break
+            curr_dir = parent
+        for path in config_paths:
+            try:
+                st = os.stat(path)
+            except (FileNotFoundError, NotADirectoryError):
+                entries.append((path, -1, -1))
+            else:
+                entries.append((path, st.st_mtime_ns, st.st_size))
+    except (OSError, ValueError, AttributeError):
+        # Unreadable trees, dangling symlinks or malformed manifests
+        return None
+
+    import hashlib  # pylint: disable=import-outside-toplevel
+
+    digest = hashlib.blake2b()
+    digest.update(f"{version}\x00".encode())
+    for name in CACHE_INPUT_ENV:
+        digest.update(f"{name}={os.environ.get(name, '')}\x00".encode())
+    for path, mtime_ns, size in sorted(entries):
+        digest.update(f"{path}\x00{mtime_ns}\x00{size}\x00".encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Persistent store of successful tool results keyed on tool, directory and inputs."""
+
+    def __init__(self, path: str = CACHE_FILE) -> None:
+        """Load previously cached results from ``path`` if present."""
+        import json  # pylint: disable=import-outside-toplevel
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: dict[str, dict] = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    @staticmethod
+    def key(
+        tool: RustTool, directory: str, packages: tuple[str, ...] = ()
+    ) -> tuple[str, str] | None:
+        """Build the ``(slot, inputs digest)`` cache key for ``tool`` in ``directory``.
+
+        Each tool command and directory owns one slot, so stale results are replaced
+        rather than accumulating. Returns None if the inputs cannot be determined.
+        """
+        directory = os.path.abspath(directory)
+        digest = inputs_digest(tool, directory)
+        if digest is None:
+            return None
+        command = " ".join(build_command(tool, packages))
+        return f"{tool.name}:{directory}:{command}", digest
+
+    def get(self, key: tuple[str, str]) -> ToolResult | None:
+        """Return the cached result for ``key`` if its inputs are unchanged."""
+        slot, digest = key
+        with self._lock:
+            entry = self._entries.get(slot)
+        if not isinstance(entry, dict) or entry.get("digest") != digest:
+            return None
         return ToolResult(
-            name=self.name,
-            success=process.returncode == 0,
-            stdout=process.stdout,
-            stderr=process.stderr,
+            name=entry.get("name", ""),
+            success=True,
+            stdout=entry.get("stdout", ""),
+            stderr=entry.get("stderr", ""),
         )
 
+    def put(self, key: tuple[str, str], result: ToolResult) -> None:
+        """Remember ``result`` under ``key``; only successful results are kept."""
+        slot, digest = key
+        with self._lock:
+            if result.success:
+                self._entries[slot] = {
+                    "digest": digest,
+                    "name": result.name,
+                    "stdout": result.stdout,
+                    "stderr": result.stderr,
+                }
+            elif self._entries.pop(slot, None) is None:
+                return
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back to disk if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            import json  # pylint: disable=import-outside-toplevel
+
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"{BLUE}Could not write result cache {self.path}: {e}{RESET}")
+            self._dirty = False
+
+
+def build_command(tool: RustTool, packages: tuple[str, ...] = ()) -> list[str]:
+    """Build the command for ``tool``, restricted to ``packages`` if given."""
+    if not packages:
+        return list(tool.command)
+    # Package selection goes right after the cargo subcommand, before any `--`
+    selection = [arg for pkg in packages for arg in ("-p", pkg)]
+    return [*tool.command[:2], *selection, *tool.command[2:]]
+
+
+def run_tool(
+    tool: RustTool,
+    directory: str,
+    cache: ResultCache | None = None,
+    on_line: Callable[[str], None] | None = None,
+    packages: tuple[str, ...] = (),
+) -> ToolResult:
+    """Run the tool command in the given directory.
+
+    The directory is expected to be a Cargo project; callers are responsible
+    for filtering out directories without a Cargo.toml. For cacheable tools, a
+    successful result cached for unchanged inputs is returned without running.
+    If ``packages`` is given, ``directory`` is a workspace root and only those
+    member packages are processed, in a single cargo invocation.
+
+    The command's stdout and stderr are read line by line as they are produced.
+    If ``on_line`` is given, each line is passed to it and not retained;
+    otherwise the output is collected into the result's ``stdout``.
+    """
+    cache_key = None
+    if cache is not None and tool.cacheable:
+        cache_key = cache.key(tool, directory, packages)
+        cached = cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            return cached
+
+    buffer = io.StringIO()
+    with subprocess.Popen(
+        build_command(tool, packages),
+        cwd=directory,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            if on_line is not None:
+                on_line(line)
+            else:
+                buffer.write(line)
+    result = ToolResult(tool.name, process.returncode == 0, buffer.getvalue(), "")
+    if cache_key is not None:
+        cache.put(cache_key, result)
+    return result
+
+
+def handle_result(result: ToolResult, directory: str, streamed: bool = False) -> bool:
+    """Handle and display the tool's result for a given directory.
+
+    ``streamed`` indicates the tool's output was already printed as it ran.
+    Returns True if the tool failed, otherwise False.
+    """
+    with _PRINT_LOCK:
+        if not result.success and streamed:
+            print(
+                f"{RED}❌ {result.name.capitalize()} failed in {directory} "
+                f"(see output above).{RESET}"
+            )
+            return True
+        if not result.success:
+            print(f"{RED}❌ {result.name.capitalize()} issues in {directory}:{RESET}")
+            if result.stdout:
+                print(result.stdout)
+            if result.stderr:
+                print(result.stderr)
+            return True
+        print(
+            f"{GREEN}✅ {result.name.capitalize()} checks passed in {directory}.{RESET}"
+        )
+        return False
+
 
 class RustToolRunner:
     """Manages and runs Rust tools (clippy, fmt, fix) across cargo projects."""
 
-    def __init__(self) -> None:
-        """Initialize with the available tools for linting, formatting, and fixing."""
-        self.linters = {
-            "clippy": BaseRustTool(
-                "clippy", lambda d: ["cargo", "clippy", "--", "-D", "warnings"]
-            ),
-        }
-        self.formatters = {
-            "fmt": BaseRustTool("fmt", lambda d: ["cargo", "fmt"]),
-        }
-        self.fixers = {
-            "fix": BaseRustTool("fix", lambda d: ["cargo", "fix"]),
-        }
-        self.unsafe_fixers = {
-            "fix": BaseRustTool(
-                "fix", lambda d: ["cargo", "fix", "--allow-dirty", "--allow-staged"]
-            ),
-        }
+    def __init__(self, jobs: int | None = None, use_cache: bool = True) -> None:
+        """Initialize with the available tools for linting, formatting, and fixing.
+
+        ``jobs`` caps the number of concurrent tool runs; defaults to the CPU count.
+        ``use_cache`` enables reuse of clean results for unchanged projects.
+        """
+        self.jobs = jobs
+        self.use_cache = use_cache
+        self.linters = LINTERS
+        self.formatters = FORMATTERS
+        self.fixers = FIXERS
+        self.unsafe_fixers = UNSAFE_FIXERS
 
     def get_tools_to_run(
         self,
@@ -124,34 +450,72 @@ class RustToolRunner:
             }
         return tools.copy()
 
-    def handle_result(self, result: ToolResult, directory: str) -> bool:
-        """Handle and display the tool's result for a given directory.
-
-        Returns True if the tool failed, otherwise False.
+    def run_on_dirs(self, tools: dict, dirs: list[str]) -> list[str]:
+        """Run each tool on the provided directories and return the names of any that fail.
+
+        Directories without a Cargo.toml are skipped up front, and crates that
+        share a workspace are processed with one cargo invocation. With a single
+        worker, tool output is streamed live with a ``[tool@dir]`` prefix.
+        Otherwise the (tool, directory) pairs are independent cargo invocations
+        dispatched to a thread pool; each task buffers its own output, which is
+        printed in one piece when the task completes.
         """
-        if not result.success:
-            print(f"{RED}❌ {result.name.capitalize()} issues in {directory}:{RESET}")
-            print(result.stdout)
-            if result.stderr:
-                print(result.stderr)
-            return True
-        print(
-            f"{GREEN}✅ {result.name.capitalize()} checks passed in {directory}.{RESET}"
-        )
-        return False
+        valid_dirs = []
+        for d in dirs:
+            if os.path.isfile(os.path.join(d, "Cargo.toml")):
+                valid_dirs.append(d)
+            else:
+                print(
+                    f"{BLUE}Skipping {d}: "
+                    f"Cargo.toml not found (not a Rust project).{RESET}"
+                )
 
-    def run_on_dirs(self, tools: dict, dirs: list[str]) -> list[str]:
-        """Run each tool on the provided directories and return the names of any that fail."""
-        failures = []
-        for tool in tools.values():
-            tool_failed = False
-            for d in dirs:
-                result = tool.run(d)
-                if self.handle_result(result, d):
-                    tool_failed = True
-            if tool_failed:
-                failures.append(tool.name)
-        return failures
+        targets = group_by_workspace(valid_dirs)
+        work = [(tool, target) for tool in tools.values() for target in targets]
+        if not work:
+            return []
+        cache = (
+            ResultCache()
+            if self.use_cache and any(tool.cacheable for tool, _ in work)
+            else None
+        )
+        max_workers = min(self.jobs or os.cpu_count() or 1, len(work))
+        tool_failed: defaultdict[str, bool] = defaultdict(bool)
+        try:
+            if max_workers == 1:
+                for tool, (d, packages) in work:
+                    prefix = f"{BLUE}[{tool.name}@{d}]{RESET} "
+                    result = run_tool(
+                        tool,
+                        d,
+                        cache,
+                        on_line=lambda line, p=prefix: print(p + line, end=""),
+                        packages=packages,
+                    )
+                    if handle_result(
+                        result, describe_target(d, packages), streamed=True
+                    ):
+                        tool_failed[tool.name] = True
+            else:
+                # pylint: disable-next=import-outside-toplevel
+                from concurrent.futures import ThreadPoolExecutor, as_completed
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(
+                            run_tool, tool, d, cache, packages=packages
+                        ): (tool, describe_target(d, packages))
+                        for tool, (d, packages) in work
+                    }
+                    for future in as_completed(futures):
+                        tool, label = futures[future]
+                        if handle_result(future.result(), label):
+                            tool_failed[tool.name] = True
+        finally:
+            if cache is not None:
+                cache.save()
+        # Report failures in tool declaration order rather than completion order
+        return [tool.name for tool in tools.values() if tool_failed[tool.name]]
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     def run(
@@ -210,56 +574,201 @@ class RustToolRunner:
         sys.exit(0)
 
 
-def find_cargo_manifest_dir(path: str) -> str | None:
+@functools.lru_cache(maxsize=None)
+def _manifest_for_dir(directory: str) -> str | None:
+    """Return the closest ancestor of ``directory`` (inclusive) containing Cargo.toml.
+
+    ``directory`` must be absolute; parents are derived with ``os.path.dirname``,
+    which is pure string work. Results are cached per directory, so sibling files
+    and shared ancestors are only stat'd once.
     """
-    Find the closest directory containing Cargo.toml starting from the file's directory.
+    try:
+        os.stat(os.path.join(directory, "Cargo.toml"))
+        return directory
+    except OSError:
+        pass
+    parent = os.path.dirname(directory)
+    if parent == directory:
+        return None
+    return _manifest_for_dir(parent)
+
+
+@functools.lru_cache(maxsize=None)
+def locate_workspace_root(manifest_dir: str) -> str | None:
+    """Return the workspace root directory of the crate in ``manifest_dir``.
+
+    Returns None if cargo cannot determine it.
     """
-    curr_dir = os.path.abspath(os.path.dirname(path))
-    while True:
-        if os.path.exists(os.path.join(curr_dir, "Cargo.toml")):
-            return curr_dir
-        parent = os.path.abspath(os.path.join(curr_dir, os.pardir))
-        if curr_dir == parent:
-            break
-        curr_dir = parent
-    return None
-
-
-def get_modified_files() -> list[str]:
-    """Get list of modified files (both staged and unstaged) from git."""
-    staged = subprocess.run(
-        ["git", "diff", "--cached", "--name-only"],
-        capture_output=True,
-        text=True,
-        check=True,
-    ).stdout.splitlines()
+    try:
+        process = subprocess.run(
+            [
+                "cargo",
+                "locate-project",
+                "--workspace",
+                "--message-format=plain",
+                "--manifest-path",
+                os.path.join(manifest_dir, "Cargo.toml"),
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    if process.returncode != 0 or not process.stdout.strip():
+        return None
+    return os.path.dirname(process.stdout.strip())
+
+
+def read_package_name(manifest_dir: str) -> str | None:
+    """Return the ``[package] name`` from the Cargo.toml in ``manifest_dir``, if any."""
+    tomllib = _tomllib()
+    if tomllib is None:
+        return None
+    try:
+        with open(os.path.join(manifest_dir, "Cargo.toml"), "rb") as f:
+            manifest = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return None
+    name = manifest.get("package", {}).get("name")
+    return name if isinstance(name, str) else None
+
+
+def group_by_workspace(dirs: list[str]) -> list[tuple[str, tuple[str, ...]]]:
+    """Group cargo project directories into ``(directory, packages)`` targets.
+
+    When several directories are member packages of the same workspace, they are
+    merged into a single target on the workspace root that selects each package
+    with ``-p``, so cargo resolves the workspace and starts up only once. Other
+    directories map to ``(directory, ())`` and are processed on their own.
+
+    A workspace is left ungrouped if any of its directories is the workspace root
+    itself or has no ``[package] name`` (e.g. a virtual manifest), since running
+    cargo there covers more than a ``-p`` selection would.
+    """
+    ungrouped = [(d, ()) for d in dirs]
+    if len(dirs) < 2 or _tomllib() is None:
+        return ungrouped
+
+    members: dict[str, dict[str, str]] = defaultdict(dict)
+    excluded: set[str] = set()
+    for d in dirs:
+        root = locate_workspace_root(os.path.abspath(d))
+        if root is None:
+            continue
+        name = read_package_name(d)
+        if (
+            name is None
+            or os.path.abspath(d) == root
+            or members[root].get(name, d) != d
+        ):
+            excluded.add(root)
+        else:
+            members[root][name] = d
 
-    unstaged = subprocess.run(
-        ["git", "diff", "--name-only"],
-        capture_output=True,
-        text=True,
-        check=False,
-    ).stdout.splitlines()
+    targets: list[tuple[str, tuple[str, ...]]] = []
+    grouped: set[str] = set()
+    covered: set[str] = set()
+    for d in dirs:
+        root = locate_workspace_root(os.path.abspath(d))
+        packages = members.get(root, {}) if root not in excluded else {}
+        if len(packages) < 2:
+            targets.append((d, ()))
+            covered.add(d)
+        elif root not in grouped:
+            grouped.add(root)
+            targets.append((root, tuple(packages)))
+            covered.update(packages.values())
 
-    # Combine and remove duplicates while preserving order
-    modified = list(dict.fromkeys(staged + unstaged))
-    modified = [f for f in modified if os.path.exists(f)]
-    if not modified:
-        print(f"{BLUE}No modified files found.{RESET}")
-        sys.exit(0)
-    return modified
+    # Every input directory must be linted by some target; never drop one
+    if covered != set(dirs):
+        return ungrouped
+    return targets
+
+
+def describe_target(directory: str, packages: tuple[str, ...]) -> str:
+    """Describe a ``(directory, packages)`` target for display."""
+    if not packages:
+        return directory
+    return f"{directory} ({', '.join(packages)})"
+
+
+# Porcelain status codes that indicate a file with content worth linting
+MODIFIED_STATUS_CODES = frozenset("MARC")
+
+
+async def iter_modified_files() -> AsyncIterator[str]:
+    """Yield modified files (both staged and unstaged) from git as they are reported.
+
+    Uses a single ``git status --porcelain=v1 -z`` call, which reports index and
+    working-tree state together, and parses its output while git is still
+    running. Deleted files are ignored and untracked files are not scanned for.
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    command = ["git", "status", "--porcelain=v1", "-z", "--untracked-files=no"]
+    process = await asyncio.create_subprocess_exec(
+        *command, stdout=asyncio.subprocess.PIPE
+    )
+    assert process.stdout is not None
+    skip_next = False
+    while True:
+        try:
+            entry = await process.stdout.readuntil(b"\x00")
+        except asyncio.IncompleteReadError as e:
+            entry = e.partial
+            if not entry:
+                break
+        entry = entry.rstrip(b"\x00")
+        if skip_next:
+            # With -z, the rename/copy source follows as its own entry
+            skip_next = False
+            continue
+        if len(entry) < 4:
+            continue
+        status, path = entry[:2].decode(), entry[3:].decode("utf-8")
+        # Renames and copies can be reported in either the index or worktree column
+        skip_next = bool({"R", "C"} & set(status))
+        if MODIFIED_STATUS_CODES.intersection(status):
+            yield path
+    if await process.wait() != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+
+async def collect_modified_dirs() -> tuple[int, list[str]]:
+    """Return the number of modified files and their cargo project directories.
+
+    Manifest lookups for each new parent directory are scheduled on a thread pool
+    as soon as git reports a file there, overlapping with the rest of the output.
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    loop = asyncio.get_running_loop()
+    files: dict[str, None] = {}
+    lookups: dict[str, asyncio.Future[str | None]] = {}
+    async for file in iter_modified_files():
+        files[file] = None
+        # Resolve each parent directory once; sibling files share the same lookup
+        parent = os.path.abspath(os.path.dirname(file))
+        if parent not in lookups:
+            lookups[parent] = loop.run_in_executor(None, _manifest_for_dir, parent)
+    manifest_dirs = await asyncio.gather(*lookups.values())
+    dirs = list(dict.fromkeys(d for d in manifest_dirs if d))
+    return len(files), dirs
 
 
 def get_modified_dirs() -> list[str]:
     """
     Determine cargo project directories from git modified files by locating the Cargo.toml.
+
+    asyncio is only imported on this path to keep bare invocations fast.
     """
-    modified_files = get_modified_files()
-    dirs = []
-    for file in modified_files:
-        manifest_dir = find_cargo_manifest_dir(file)
-        if manifest_dir and manifest_dir not in dirs:
-            dirs.append(manifest_dir)
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    file_count, dirs = asyncio.run(collect_modified_dirs())
+    if not file_count:
+        print(f"{BLUE}No modified files found.{RESET}")
+        sys.exit(0)
     if not dirs:
         print(f"{BLUE}No modified cargo projects found.{RESET}")
         sys.exit(0)
@@ -267,7 +776,17 @@ def get_modified_dirs() -> list[str]:
 
 
 def main() -> None:
-    """Main entry point for the Rust lint command."""
+    """Main entry point for the Rust lint command.
+
+    A bare invocation (no arguments) runs the default linters directly without
+    building the argument parser; any arguments go through the full parser.
+    """
+    if len(sys.argv) == 1:
+        RustToolRunner().run()
+        return
+
+    import argparse  # pylint: disable=import-outside-toplevel
+
     runner = RustToolRunner()
 
     parser = argparse.ArgumentParser(
@@ -311,7 +830,23 @@ def main() -> None:
         action="store_true",
         help="Run on git modified files (determine cargo project roots from modified files).",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Maximum number of cargo commands to run concurrently (default: CPU count).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run the tools, ignoring results cached from previous clean runs.",
+    )
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    runner.jobs = args.jobs
+    runner.use_cache = not args.no_cache
 
     if args.git_modified:
         target_paths = get_modified_dirs()